@@ -2,25 +2,102 @@
 """
 Terminal Task Manager (OOP)
 Save as task_manager.py and run: python task_manager.py
+Non-interactive: python task_manager.py --batch < commands.txt  (see run_batch)
 """
+import itertools
 import json
+import os
+import shlex
+import sys
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 from datetime import datetime, date, timedelta
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional speedup; records are decoded via dicts and Task.from_dict
+    msgspec = None
+
+try:
+    import numpy as np
+except ImportError:  # optional speedup; filters fall back to plain Python loops
+    np = None
 
 
 DATE_FORMAT = "%Y-%m-%d"  # ISO format for due dates
+READ_BUFFER_SIZE = 64 * 1024  # read the task file in large chunks
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}  # display order, most urgent first
+STATUS_CODE = {"Pending": 0, "Completed": 1}
+UNKNOWN_CODE = 255  # code for a priority/status string outside the tables above
+
+# task table layout, formatted once at import instead of per row
+_TITLE_WIDTH = 40  # longer titles are cut to fit and end in "..."
+_COL_WIDTHS = (4, _TITLE_WIDTH, 8, 12, 10)  # approximate widths
+_ROW_FMT = "| " + " | ".join(f"{{:<{w}}}" for w in _COL_WIDTHS) + " |"
+_TABLE_RULE = "-" * (sum(_COL_WIDTHS) + len(_COL_WIDTHS) * 3)
+_TABLE_HEADER = _ROW_FMT.format("ID", "Title", "Priority", "Due Date", "Status")
+
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_date(s: str) -> date:
+    """Parse a DATE_FORMAT string; raises ValueError if it is not a valid date."""
+    # fromisoformat is implemented in C and, for this fixed ISO format, far
+    # cheaper than strptime's format-string interpreter (or a Python-level
+    # parser). It also accepts other ISO shapes such as 20251114 and 2025-W46-5,
+    # so only hand it the zero-padded YYYY-MM-DD layout.
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        return date.fromisoformat(s)
+    # anything else (e.g. unpadded 2025-1-5) goes through strptime as before
+    return datetime.strptime(s, DATE_FORMAT).date()
 
 
 class Task:
     VALID_PRIORITIES = ("Low", "Medium", "High")
     VALID_STATUSES = ("Pending", "Completed")
 
+    # fields plus the cached values maintained by _refresh_cache()
+    __slots__ = ("id", "title", "priority", "due_date", "status",
+                 "_due_str", "_due_ord", "_display_title", "_prio_code", "_status_code", "_sort_key")
+
     def __init__(self, id: int, title: str, priority: str, due_date: date, status: str = "Pending"):
         self.id = id
         self.title = title.strip()
         self.priority = priority
         self.due_date = due_date
         self.status = status
+        self._refresh_cache()
+
+    def _refresh_cache(self):
+        """Recompute values derived from the fields; call after changing any of them."""
+        # DATE_FORMAT is ISO, so isoformat() gives the same text without strftime
+        self._due_str = self.due_date.isoformat()
+        self._due_ord = self.due_date.toordinal()  # int, cheaper to compare than date
+        title = self.title
+        self._display_title = (title[: (_TITLE_WIDTH - 3)] + "...") if len(title) > _TITLE_WIDTH else title
+        # small-int codes so filters and sorting compare ints, not strings
+        self._prio_code = PRIORITY_RANK.get(self.priority, UNKNOWN_CODE)
+        self._status_code = STATUS_CODE.get(self.status, UNKNOWN_CODE)
+        # display order key: due date, then priority, then id
+        self._sort_key = (self._due_ord, self._prio_code, self.id)
 
     def to_dict(self) -> dict:
         """Convert Task to JSON-serializable dict."""
@@ -28,14 +105,14 @@ class Task:
             "id": self.id,
             "title": self.title,
             "priority": self.priority,
-            "due_date": self.due_date.strftime(DATE_FORMAT),
+            "due_date": self._due_str,
             "status": self.status,
         }
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create Task instance from dict loaded from JSON."""
-        due_date = datetime.strptime(data["due_date"], DATE_FORMAT).date()
+        due_date = _parse_date(data["due_date"])
         return cls(
             id=int(data["id"]),
             title=data["title"],
@@ -48,24 +125,78 @@ class Task:
         return f"<Task {self.id}: {self.title} ({self.priority}) due {self.due_date} [{self.status}]>"
 
 
+if msgspec is not None:
+    class _TaskRecord(msgspec.Struct):
+        """On-disk shape of a task; msgspec decodes JSON straight into these."""
+        id: int
+        title: str
+        priority: str
+        due_date: str
+        status: str = "Pending"
+
+    _decode_records = msgspec.json.Decoder(List[_TaskRecord], strict=False).decode
+    _DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError)
+else:
+    _DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+def _decode_tasks(raw: bytes) -> List[Task]:
+    """Parse the task file contents into Task objects."""
+    if msgspec is not None:
+        try:
+            records = _decode_records(raw)
+        except msgspec.ValidationError:
+            # valid JSON but not the typed shape (e.g. "status": null); let the
+            # lenient Task.from_dict path decide, exactly as without msgspec
+            pass
+        else:
+            return [
+                Task(r.id, r.title, r.priority, _parse_date(r.due_date), r.status)
+                for r in records
+            ]
+    return [Task.from_dict(item) for item in _loads(raw)]
+
+
+# key function for sorting/bisecting task_list; attrgetter avoids a Python-level call per task
+_by_sort_key = attrgetter("_sort_key")
+
+
 class TaskManager:
-    def __init__(self, filename: str = "tasks.json"):
-        self.task_list: List[Task] = []
+    FLUSH_EVERY = 20  # write pending changes after this many unsaved mutations
+    VECTOR_MIN_TASKS = 2000  # below this, plain loops beat numpy's per-call overhead
+
+    def __init__(self, filename: str = "tasks.json", autoflush: bool = True):
+        """autoflush=False disables the periodic FLUSH_EVERY write; call flush() yourself."""
+        self.task_list: List[Task] = []  # kept sorted by Task._sort_key
+        self._by_id: Dict[int, Task] = {}
+        self._columns = None  # cached numpy columns over task_list, see _get_columns()
         self.filename = filename
-        self._next_id = 1
+        self._max_id = 0  # highest id in use; new ids are _max_id + 1
+        self._autoflush = autoflush
+        self._dirty = False
+        self._pending = 0
         self.load_from_file()
 
     # ---------- ID handling ----------
     def _generate_id(self) -> int:
-        id_ = self._next_id
-        self._next_id += 1
-        return id_
+        self._max_id += 1
+        return self._max_id
 
-    def _recompute_next_id(self):
-        if not self.task_list:
-            self._next_id = 1
-        else:
-            self._next_id = max(task.id for task in self.task_list) + 1
+    def _recompute_max_id(self):
+        self._max_id = max(self._by_id, default=0)
+
+    # ---------- Persistence batching ----------
+    def _mark_dirty(self):
+        """Record a mutation; the file is rewritten on flush() or every FLUSH_EVERY changes."""
+        self._dirty = True
+        self._pending += 1
+        if self._autoflush and self._pending >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """Write tasks to file if there are unsaved changes."""
+        if self._dirty:
+            self.save_to_file()
 
     # ---------- CRUD ----------
     def add_task(self, title: str, priority: str, due_date: date) -> Task:
@@ -73,71 +204,83 @@ class TaskManager:
         if priority not in Task.VALID_PRIORITIES:
             raise ValueError(f"Priority must be one of {Task.VALID_PRIORITIES}")
         new_task = Task(self._generate_id(), title, priority, due_date)
-        self.task_list.append(new_task)
-        self.save_to_file()
+        self._insert_sorted(new_task)
+        self._by_id[new_task.id] = new_task
+        self._mark_dirty()
         return new_task
 
     def view_tasks(self, tasks: Optional[List[Task]] = None):
         """Display tasks in a formatted table. If tasks is None, display all."""
-        tasks_to_show = tasks if tasks is not None else list(self.task_list)
+        # task_list is already in display order and is shown as is. Any list
+        # passed in (filter_tasks results included) is sorted by the cached key;
+        # filter output is already ordered, so that sort is a single linear pass.
+        tasks_to_show = self.task_list if tasks is None else sorted(tasks, key=_by_sort_key)
         if not tasks_to_show:
             print("\nNo tasks to show.\n")
             return
 
-        # Sort by due date then priority then id
-        def sort_key(t: Task):
-            prio_map = {"High": 0, "Medium": 1, "Low": 2}
-            return (t.due_date, prio_map.get(t.priority, 3), t.id)
-
-        tasks_to_show = sorted(tasks_to_show, key=sort_key)
-
-        # Prepare table
-        headers = ["ID", "Title", "Priority", "Due Date", "Status"]
-        col_widths = [4, 40, 8, 12, 10]  # approximate widths
-
-        line = "-" * (sum(col_widths) + len(col_widths) * 3)
-        print(line)
-        print(
-            f"| {headers[0]:<{col_widths[0]}} | {headers[1]:<{col_widths[1]}} | "
-            f"{headers[2]:<{col_widths[2]}} | {headers[3]:<{col_widths[3]}} | {headers[4]:<{col_widths[4]}} |"
-        )
-        print(line)
+        # build the whole table and write it once instead of one print per row
+        out = [_TABLE_RULE, _TABLE_HEADER, _TABLE_RULE]
+        row_fmt = _ROW_FMT.format
         for t in tasks_to_show:
-            title = (t.title[: (col_widths[1] - 3)] + "...") if len(t.title) > col_widths[1] else t.title
-            print(
-                f"| {t.id:<{col_widths[0]}} | {title:<{col_widths[1]}} | "
-                f"{t.priority:<{col_widths[2]}} | {t.due_date.strftime(DATE_FORMAT):<{col_widths[3]}} | "
-                f"{t.status:<{col_widths[4]}} |"
-            )
-        print(line)
-        print()
+            out.append(row_fmt(t.id, t._display_title, t.priority, t._due_str, t.status))
+        out.append(_TABLE_RULE)
+        sys.stdout.write("\n".join(out) + "\n\n")
+
+    def _index_of(self, task: Task) -> int:
+        """Position of task in the sorted task_list."""
+        return bisect_left(self.task_list, task._sort_key, key=_by_sort_key)
+
+    def _insert_sorted(self, task: Task):
+        """Insert task at its sorted position, keeping the numpy columns in step."""
+        i = bisect_right(self.task_list, task._sort_key, key=_by_sort_key)
+        self.task_list.insert(i, task)
+        if self._columns is not None:
+            due, status = self._columns
+            self._columns = (np.insert(due, i, task._due_ord), np.insert(status, i, task._status_code))
+
+    def _remove_at(self, i: int):
+        """Remove the task at position i, keeping the numpy columns in step."""
+        self.task_list.pop(i)
+        if self._columns is not None:
+            due, status = self._columns
+            self._columns = (np.delete(due, i), np.delete(status, i))
 
     def find_task_by_id(self, task_id: int) -> Optional[Task]:
-        for t in self.task_list:
-            if t.id == task_id:
-                return t
-        return None
+        return self._by_id.get(task_id)
 
     def update_task(self, task_id: int, title: Optional[str] = None, priority: Optional[str] = None,
                     due_date: Optional[date] = None, status: Optional[str] = None) -> bool:
         task = self.find_task_by_id(task_id)
         if not task:
             return False
-        if title is not None:
-            task.title = title.strip()
-        if priority is not None:
-            priority = priority.title()
-            if priority not in Task.VALID_PRIORITIES:
-                raise ValueError(f"Priority must be one of {Task.VALID_PRIORITIES}")
-            task.priority = priority
-        if due_date is not None:
-            task.due_date = due_date
-        if status is not None:
-            status = status.title()
-            if status not in Task.VALID_STATUSES:
-                raise ValueError(f"Status must be one of {Task.VALID_STATUSES}")
-            task.status = status
-        self.save_to_file()
+        # priority and due date move the task in the sorted list; take it out
+        # first and put it back even if validation below fails part-way
+        resort = priority is not None or due_date is not None
+        if resort:
+            self._remove_at(self._index_of(task))
+        try:
+            if title is not None:
+                task.title = title.strip()
+            if priority is not None:
+                priority = priority.title()
+                if priority not in Task.VALID_PRIORITIES:
+                    raise ValueError(f"Priority must be one of {Task.VALID_PRIORITIES}")
+                task.priority = priority
+            if due_date is not None:
+                task.due_date = due_date
+            if status is not None:
+                status = status.title()
+                if status not in Task.VALID_STATUSES:
+                    raise ValueError(f"Status must be one of {Task.VALID_STATUSES}")
+                task.status = status
+        finally:
+            task._refresh_cache()
+            if resort:
+                self._insert_sorted(task)
+            elif self._columns is not None:
+                self._columns[1][self._index_of(task)] = task._status_code
+        self._mark_dirty()
         return True
 
     def mark_complete(self, task_id: int) -> bool:
@@ -147,12 +290,45 @@ class TaskManager:
         task = self.find_task_by_id(task_id)
         if not task:
             return False
-        self.task_list.remove(task)
-        self.save_to_file()
-        self._recompute_next_id()
+        self._remove_at(self._index_of(task))
+        del self._by_id[task_id]
+        self._mark_dirty()
+        # only deleting the current max can change the next id
+        if task_id == self._max_id:
+            self._recompute_max_id()
         return True
 
     # ---------- Filtering ----------
+    def _get_columns(self):
+        """
+        Return (due_ordinals, status_codes) numpy arrays parallel to task_list,
+        or None when numpy is missing or the list is too small to benefit.
+        Built on first use, then updated in place by add/update/delete.
+        """
+        if np is None or len(self.task_list) < self.VECTOR_MIN_TASKS:
+            self._columns = None
+            return None
+        if self._columns is None:
+            n = len(self.task_list)
+            due = np.fromiter((t._due_ord for t in self.task_list), dtype=np.int32, count=n)
+            status = np.fromiter((t._status_code for t in self.task_list), dtype=np.uint8, count=n)
+            self._columns = (due, status)
+        return self._columns
+
+    def _select(self, mask) -> List[Task]:
+        # compress() walks the bool list in C, so even a mask matching every
+        # task costs no more than the plain comprehension
+        return list(itertools.compress(self.task_list, mask.tolist()))
+
+    def _filter_due_range(self, start: date, end: date) -> List[Task]:
+        """Tasks with start <= due_date <= end."""
+        lo, hi = start.toordinal(), end.toordinal()
+        columns = self._get_columns()
+        if columns is None:
+            return [t for t in self.task_list if lo <= t._due_ord <= hi]
+        due, _ = columns
+        return self._select((due >= lo) & (due <= hi))
+
     def filter_tasks(self, by: str = "status", value: Optional[str] = None) -> List[Task]:
         """
         by: 'status' or 'due_date'
@@ -164,54 +340,129 @@ class TaskManager:
             if not value:
                 return []
             val = value.title()
-            return [t for t in self.task_list if t.status == val]
+            code = STATUS_CODE.get(val)
+            if code is None:
+                # a status outside the table (e.g. hand-edited "In Progress")
+                # has no code; compare the strings like before
+                return [t for t in self.task_list if t.status == val]
+            columns = self._get_columns()
+            if columns is None:
+                return [t for t in self.task_list if t._status_code == code]
+            _, status = columns
+            return self._select(status == code)
         elif by == "due_date":
             if not value:
                 return []
             val = value.lower()
             today = date.today()
             if val == "today":
-                return [t for t in self.task_list if t.due_date == today]
+                return self._filter_due_range(today, today)
             elif val == "week":
-                week_end = today + timedelta(days=7)
-                return [t for t in self.task_list if today <= t.due_date <= week_end]
+                return self._filter_due_range(today, today + timedelta(days=7))
             else:
                 # support filtering by specific date string YYYY-MM-DD
                 try:
-                    specific = datetime.strptime(value, DATE_FORMAT).date()
-                    return [t for t in self.task_list if t.due_date == specific]
+                    specific = _parse_date(value)
                 except Exception:
                     return []
+                return self._filter_due_range(specific, specific)
         else:
             return []
 
+    # ---------- Programmatic access ----------
+    _OPERATIONS = {
+        "add": "add_task",
+        "update": "update_task",
+        "complete": "mark_complete",
+        "delete": "delete_task",
+        "filter": "filter_tasks",
+        "save": "save_to_file",
+        "load": "load_from_file",
+    }
+
+    def apply(self, op: str, **kwargs):
+        """
+        Run one operation by name, without any CLI rendering.
+        String task_id / due_date arguments are converted, so values parsed
+        from text can be passed straight through. Returns the method's result.
+        """
+        name = self._OPERATIONS.get(op.lower())
+        if name is None:
+            raise ValueError(f"Unknown operation '{op}'. Choose from {tuple(self._OPERATIONS)}")
+        if isinstance(kwargs.get("task_id"), str):
+            kwargs["task_id"] = int(kwargs["task_id"])
+        if isinstance(kwargs.get("due_date"), str):
+            kwargs["due_date"] = _parse_date(kwargs["due_date"])
+        return getattr(self, name)(**kwargs)
+
     # ---------- File I/O ----------
     def save_to_file(self):
+        # write the whole payload to a temp file, then atomically swap it in.
+        # Resolve symlinks so the link's target is replaced, not the link itself.
+        target = os.path.realpath(self.filename)
+        tmp = target + ".tmp"
         try:
-            data = [t.to_dict() for t in self.task_list]
-            with open(self.filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            payload = memoryview(_dumps([t.to_dict() for t in self.task_list]))
+            try:
+                mode = os.stat(target).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = None
+            # raw fd instead of a Python file object: no buffer setup, open/write/fsync/close only
+            # O_BINARY (Windows only) stops the C runtime turning \n into \r\n
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open(tmp, flags, 0o666)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                # make the data durable before the rename can expose it; otherwise
+                # a power loss could leave tasks.json pointing at unwritten blocks
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if mode is not None:
+                # keep the existing file's permissions across the replace
+                # (os.chmod on the path, since os.fchmod is Unix-only before 3.13)
+                os.chmod(tmp, mode)
+            os.replace(tmp, target)
+            self._dirty = False
+            self._pending = 0
         except Exception as e:
             print(f"Error saving tasks: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
 
     def load_from_file(self):
+        # save pending changes first so reloading never silently discards them
+        self.flush()
         try:
-            with open(self.filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.task_list = [Task.from_dict(item) for item in data]
-            self._recompute_next_id()
+            with open(self.filename, "rb", buffering=READ_BUFFER_SIZE) as f:
+                raw = f.read()
+            self.task_list = sorted(_decode_tasks(raw), key=_by_sort_key)
+            self._by_id = {t.id: t for t in self.task_list}
+            self._columns = None
+            self._recompute_max_id()
+            self._dirty = False
+            self._pending = 0
         except FileNotFoundError:
             # no file yet; start empty
             self.task_list = []
-            self._next_id = 1
-        except json.JSONDecodeError:
+            self._by_id = {}
+            self._columns = None
+            self._max_id = 0
+        except _DECODE_ERRORS:
             print("Warning: tasks.json is corrupted. Starting with an empty task list.")
             self.task_list = []
-            self._next_id = 1
+            self._by_id = {}
+            self._columns = None
+            self._max_id = 0
         except Exception as e:
             print(f"Error loading tasks: {e}")
             self.task_list = []
-            self._next_id = 1
+            self._by_id = {}
+            self._columns = None
+            self._max_id = 0
 
 
 # ---------- Helper functions for CLI ----------
@@ -220,7 +471,7 @@ def parse_date_input(s: str) -> Optional[date]:
     if not s:
         return None
     try:
-        return datetime.strptime(s, DATE_FORMAT).date()
+        return _parse_date(s)
     except ValueError:
         print(f"Invalid date format. Please use {DATE_FORMAT} (e.g. 2025-11-14).")
         return None
@@ -279,128 +530,204 @@ def view_menu():
     print("0) Back")
 
 
+def run_batch(commands: Iterable[str], filename: str = "tasks.json") -> TaskManager:
+    """
+    Apply commands without the interactive menus, one per line, e.g.
+        add title="Buy milk" priority=High due_date=2025-11-14
+        complete task_id=1
+    Blank lines and # comments are skipped. Changes are written once at the end.
+    A filter line (e.g. filter by=status value=Pending) prints its matches as a table.
+    A malformed line, or an update/complete/delete of a missing task, raises
+    ValueError naming the line; changes from earlier lines are still saved.
+    """
+    tm = TaskManager(filename, autoflush=False)
+    try:
+        for lineno, line in enumerate(commands, 1):
+            try:
+                parts = shlex.split(line, comments=True)
+                if not parts:
+                    continue
+                op, args = parts[0], parts[1:]
+                bad = [arg for arg in args if "=" not in arg]
+                if bad:
+                    raise ValueError(f"expected key=value, got {bad[0]!r}")
+                kwargs = dict(arg.split("=", 1) for arg in args)
+                result = tm.apply(op, **kwargs)
+                # update/complete/delete return False when the id does not exist
+                if result is False:
+                    raise ValueError(f"no task with id {kwargs.get('task_id')}")
+                if op.lower() == "filter":
+                    tm.view_tasks(result)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"line {lineno}: {e}") from e
+    finally:
+        tm.flush()
+    return tm
+
+
 def run_cli():
     tm = TaskManager()
-    while True:
-        main_menu()
-        choice = input("Choose an option: ").strip()
-        if choice == "1":
-            print("\n--- Add Task ---")
-            title = input_non_empty("Title: ")
-            priority = choose_priority()
-            due = input_date()
-            task = tm.add_task(title, priority, due)
-            print(f"Task added: {task}\n")
-
-        elif choice == "2":
-            print("\n--- View Tasks ---")
-            view_menu()
-            sub = input("Choose view option: ").strip()
-            if sub == "1":
-                tm.view_tasks()
-            elif sub == "2":
-                status = input("Enter status (Pending/Completed): ").strip().title()
-                tasks = tm.filter_tasks(by="status", value=status)
-                tm.view_tasks(tasks)
-            elif sub == "3":
-                print("a) Today\nb) This Week\nc) Specific Date (YYYY-MM-DD)")
-                opt = input("Choose: ").strip().lower()
-                if opt == "a":
-                    tasks = tm.filter_tasks(by="due_date", value="today")
-                    tm.view_tasks(tasks)
-                elif opt == "b":
-                    tasks = tm.filter_tasks(by="due_date", value="week")
-                    tm.view_tasks(tasks)
-                elif opt == "c":
-                    s = input("Enter date (YYYY-MM-DD): ").strip()
-                    tasks = tm.filter_tasks(by="due_date", value=s)
-                    tm.view_tasks(tasks)
-                else:
-                    print("Unknown option.\n")
-            elif sub == "0":
-                pass
-            else:
-                print("Unknown option.\n")
-
-        elif choice == "3":
-            print("\n--- Update Task ---")
-            tid = input_int("Enter task ID to update: ")
-            task = tm.find_task_by_id(tid)
-            if not task:
-                print("Task not found.\n")
-                continue
-            print("Leave a field empty to keep current value.")
-            print(f"Current title: {task.title}")
-            new_title = input("New title: ").strip()
-            print(f"Current priority: {task.priority}")
-            new_priority = input("New priority (Low/Medium/High): ").strip()
-            print(f"Current due date: {task.due_date.strftime(DATE_FORMAT)}")
-            new_due = input("New due date (YYYY-MM-DD): ").strip()
-            print(f"Current status: {task.status}")
-            new_status = input("New status (Pending/Completed): ").strip()
-
-            kwargs = {}
-            if new_title:
-                kwargs["title"] = new_title
-            if new_priority:
-                kwargs["priority"] = new_priority
-            if new_due:
-                parsed = parse_date_input(new_due)
-                if parsed is None:
-                    print("Aborting update due to invalid date.\n")
-                    continue
-                kwargs["due_date"] = parsed
-            if new_status:
-                kwargs["status"] = new_status
+    try:
+        _cli_loop(tm)
+    finally:
+        # persist anything still pending, even on Ctrl-C / EOF
+        tm.flush()
+
+
+def _handle_add(tm: TaskManager):
+    print("\n--- Add Task ---")
+    title = input_non_empty("Title: ")
+    priority = choose_priority()
+    due = input_date()
+    task = tm.add_task(title, priority, due)
+    print(f"Task added: {task}\n")
+
+
+def _handle_view(tm: TaskManager):
+    print("\n--- View Tasks ---")
+    view_menu()
+    sub = input("Choose view option: ").strip()
+    if sub == "1":
+        tm.view_tasks()
+    elif sub == "2":
+        status = input("Enter status (Pending/Completed): ").strip().title()
+        tasks = tm.filter_tasks(by="status", value=status)
+        tm.view_tasks(tasks)
+    elif sub == "3":
+        print("a) Today\nb) This Week\nc) Specific Date (YYYY-MM-DD)")
+        opt = input("Choose: ").strip().lower()
+        if opt == "a":
+            tasks = tm.filter_tasks(by="due_date", value="today")
+            tm.view_tasks(tasks)
+        elif opt == "b":
+            tasks = tm.filter_tasks(by="due_date", value="week")
+            tm.view_tasks(tasks)
+        elif opt == "c":
+            s = input("Enter date (YYYY-MM-DD): ").strip()
+            tasks = tm.filter_tasks(by="due_date", value=s)
+            tm.view_tasks(tasks)
+        else:
+            print("Unknown option.\n")
+    elif sub == "0":
+        pass
+    else:
+        print("Unknown option.\n")
+
+
+def _handle_update(tm: TaskManager):
+    print("\n--- Update Task ---")
+    tid = input_int("Enter task ID to update: ")
+    task = tm.find_task_by_id(tid)
+    if not task:
+        print("Task not found.\n")
+        return
+    print("Leave a field empty to keep current value.")
+    print(f"Current title: {task.title}")
+    new_title = input("New title: ").strip()
+    print(f"Current priority: {task.priority}")
+    new_priority = input("New priority (Low/Medium/High): ").strip()
+    print(f"Current due date: {task._due_str}")
+    new_due = input("New due date (YYYY-MM-DD): ").strip()
+    print(f"Current status: {task.status}")
+    new_status = input("New status (Pending/Completed): ").strip()
+
+    kwargs = {}
+    if new_title:
+        kwargs["title"] = new_title
+    if new_priority:
+        kwargs["priority"] = new_priority
+    if new_due:
+        parsed = parse_date_input(new_due)
+        if parsed is None:
+            print("Aborting update due to invalid date.\n")
+            return
+        kwargs["due_date"] = parsed
+    if new_status:
+        kwargs["status"] = new_status
 
-            try:
-                updated = tm.update_task(tid, **kwargs)
-                if updated:
-                    print("Task updated.\n")
-                else:
-                    print("Failed to update task.\n")
-            except ValueError as e:
-                print(f"Update error: {e}\n")
-
-        elif choice == "4":
-            print("\n--- Mark Task as Complete ---")
-            tid = input_int("Enter task ID to mark complete: ")
-            if tm.mark_complete(tid):
-                print("Task marked as Completed.\n")
-            else:
-                print("Task not found.\n")
-
-        elif choice == "5":
-            print("\n--- Delete Task ---")
-            tid = input_int("Enter task ID to delete: ")
-            task = tm.find_task_by_id(tid)
-            if not task:
-                print("Task not found.\n")
-                continue
-            confirm = input(f"Are you sure you want to delete task {tid} ('{task.title}')? (y/N): ").strip().lower()
-            if confirm == "y":
-                if tm.delete_task(tid):
-                    print("Task deleted.\n")
-                else:
-                    print("Could not delete task.\n")
-            else:
-                print("Delete cancelled.\n")
+    try:
+        updated = tm.update_task(tid, **kwargs)
+        if updated:
+            print("Task updated.\n")
+        else:
+            print("Failed to update task.\n")
+    except ValueError as e:
+        print(f"Update error: {e}\n")
+
+
+def _handle_complete(tm: TaskManager):
+    print("\n--- Mark Task as Complete ---")
+    tid = input_int("Enter task ID to mark complete: ")
+    if tm.mark_complete(tid):
+        print("Task marked as Completed.\n")
+    else:
+        print("Task not found.\n")
+
+
+def _handle_delete(tm: TaskManager):
+    print("\n--- Delete Task ---")
+    tid = input_int("Enter task ID to delete: ")
+    task = tm.find_task_by_id(tid)
+    if not task:
+        print("Task not found.\n")
+        return
+    confirm = input(f"Are you sure you want to delete task {tid} ('{task.title}')? (y/N): ").strip().lower()
+    if confirm == "y":
+        if tm.delete_task(tid):
+            print("Task deleted.\n")
+        else:
+            print("Could not delete task.\n")
+    else:
+        print("Delete cancelled.\n")
 
-        elif choice == "6":
-            tm.save_to_file()
-            print("Saved to file.\n")
 
-        elif choice == "7":
-            tm.load_from_file()
-            print("Loaded tasks from file.\n")
+def _handle_save(tm: TaskManager):
+    tm.save_to_file()
+    print("Saved to file.\n")
 
-        elif choice == "0":
-            print("Exiting. Goodbye!")
-            break
 
-        else:
-            print("Invalid option. Choose again.\n")
+def _handle_load(tm: TaskManager):
+    tm.load_from_file()
+    print("Loaded tasks from file.\n")
+
+
+def _handle_exit(tm: TaskManager):
+    tm.flush()
+    print("Exiting. Goodbye!")
+    return True
+
+
+def _handle_unknown(tm: TaskManager):
+    print("Invalid option. Choose again.\n")
+
+
+# menu choice -> handler; a handler returns True to leave the menu loop
+_HANDLERS = {
+    "1": _handle_add,
+    "2": _handle_view,
+    "3": _handle_update,
+    "4": _handle_complete,
+    "5": _handle_delete,
+    "6": _handle_save,
+    "7": _handle_load,
+    "0": _handle_exit,
+}
+
+
+def _cli_loop(tm: TaskManager):
+    while True:
+        main_menu()
+        choice = input("Choose an option: ").strip()
+        if _HANDLERS.get(choice, _handle_unknown)(tm):
+            break
 
 
 if __name__ == "__main__":
-    run_cli()
+    if sys.argv[1:] == ["--batch"]:
+        try:
+            run_batch(sys.stdin)
+        except ValueError as e:
+            # report the offending line on stderr and exit non-zero, no traceback
+            sys.exit(f"Batch error: {e}")
+    else:
+        run_cli()